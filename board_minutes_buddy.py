@@ -6,16 +6,162 @@ Converts R script functionality to Python with tkinter GUI
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import functools
+import hashlib
+import io
 import json
 import os
+import pickle
+import queue
 import re
 import random
+import sys
+import tempfile
 from pathlib import Path
 import openai
 from docx import Document
 from docx.shared import Inches
 import threading
+import time
 import configparser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# orjson is optional; it parses large example lines considerably faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Default values for persistent settings
+_DEFAULT_SETTINGS = {
+    'model': 'gpt-4.1',
+    'api_key': '',
+    'template_path': '',
+    'examples_path': '',
+    'combine_requests': False,
+    'parallel_requests': 8,
+    'requests_per_minute': 60,
+}
+
+# Output token limits for a single request; combined requests share the same cap
+_MIN_OUTPUT_TOKENS = 800
+_MAX_OUTPUT_TOKENS = 6500
+
+# How often queued log messages are flushed to the status area
+_LOG_DRAIN_INTERVAL_MS = 100
+
+# Read buffer for transcript and examples files (default is only 8 KiB)
+_READ_BUFFER_SIZE = 1 << 20
+
+# Markdown heading level for each Word heading style (lowercased style name)
+_HEADING_LEVELS = {'heading 1': 1, 'heading 2': 2, 'heading 3': 3}
+
+# Precompiled patterns used by the text extraction and parsing loops
+_WS = re.compile(r'\s+')
+_SPACE_TAB = re.compile(r'[ \t]+')
+_MULTI_NL = re.compile(r'\n{3,}')
+_HEADING_MD = re.compile(r'^(#{1,6})\s+(.*)')
+_BULLET = re.compile(r'^[-*+]\s+')
+_NUMLIST = re.compile(r'^\d+\.\s+')
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_INLINE_RE = re.compile(r'\*\*(?P<b>.*?)\*\*|(?<!\*)\*(?P<i>[^*]+?)\*(?!\*)')
+_SECTION_KEYWORDS = frozenset({'CALL TO ORDER', 'COMMUNICATIONS', 'CONSENT AGENDA', 'ACTION ITEM',
+                               'DISCUSSION', 'INFORMATION', 'ADJOURN'})
+_SECTION_HDR_RE = re.compile('|'.join(sorted(_SECTION_KEYWORDS)))
+
+# Non-markdown heading patterns as one case-insensitive alternation:
+# 1. 2. 3. | I. II. III. | A. B. C. | ALL CAPS (bounded, spaces only - lines are already split)
+# IGNORECASE is compiled in once and covers every branch, as the old per-call flag did,
+# so the "caps" branch also accepts lower-case words; get_heading_level checks isupper().
+_HEADING_COMBINED = re.compile(r'^(?:(?P<num>\d+\.\s+)|(?P<roman>[IVX]+\.\s+)|(?P<alpha>[A-Z]\.\s+)'
+                               r'|(?P<caps>[A-Z][A-Z ]{1,99}:?))', re.IGNORECASE)
+
+# Meeting section prefixes and meeting terms, checked with plain string operations
+_SECTIONS = ('CALL TO ORDER', 'COMMUNICATIONS', 'CONSENT AGENDA', 'ACTION ITEMS', 'INFORMATION ITEMS', 'ADJOURN')
+_MEETING_TERMS = ('REPORT', 'MINUTES', 'AGENDA', 'DISCUSSION', 'ACTION', 'MOTION')
+_MEETING_TERMS_SET = frozenset(_MEETING_TERMS)
+
+def _file_cache_key(path):
+    """Build a cache key that changes whenever the file on disk changes"""
+    st = os.stat(path)
+    return (path, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=1)
+def _cache_dir():
+    """Per-user directory for derived data, so nothing is written beside shared input files"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(str(Path.home()), 'AppData', 'Local')
+    elif sys.platform == 'darwin':
+        base = os.path.join(str(Path.home()), 'Library', 'Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(str(Path.home()), '.cache')
+    return os.path.join(base, 'BoardMinutesBuddy')
+
+def _examples_cache_entry(path):
+    """Return (cache file path, validity key) for the parsed copy of an examples file"""
+    path = os.path.abspath(path)
+    bundle_dir = getattr(sys, '_MEIPASS', None)
+    if bundle_dir and os.path.normcase(path).startswith(os.path.normcase(bundle_dir) + os.sep):
+        # One-file builds extract bundled data to a new temp dir per launch, so key it by the executable
+        name = 'bundle:' + os.path.relpath(path, bundle_dir)
+        st = os.stat(sys.executable)
+        key = (name, st.st_mtime_ns, st.st_size)
+    else:
+        name = path
+        key = _file_cache_key(path)
+    digest = hashlib.sha256(name.encode('utf-8')).hexdigest()
+    return os.path.join(_cache_dir(), f"examples-{digest}.pkl"), key
+
+@functools.lru_cache(maxsize=1)
+def _search_dirs():
+    """Directories searched for the template and examples files, computed once"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    home = str(Path.home())
+    return (script_dir, os.getcwd(), home, os.path.join(home, "Documents"))
+
+def _find_in_search_dirs(filenames):
+    """Return the first existing file among the search directories, or None"""
+    # normcase keeps matching case-insensitive on Windows, as os.path.exists was
+    wanted = [os.path.normcase(filename) for filename in filenames]
+    wanted_set = set(wanted)
+    for directory in _search_dirs():
+        # One directory listing per location instead of a stat per candidate path
+        found = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = os.path.normcase(entry.name)
+                    if name in wanted_set and entry.is_file():
+                        found[name] = entry.path
+        except OSError:
+            continue
+        
+        # Respect the caller's preference order within a directory
+        for filename in wanted:
+            if filename in found:
+                return found[filename]
+    return None
+
+def _has_style(doc, name):
+    """Check whether a document defines a style with the given name"""
+    return any(style.name == name for style in doc.styles)
+
+class _RateLimiter:
+    """Space out request starts so no more than per_minute begin in any minute"""
+    def __init__(self, per_minute):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_start = 0.0
+    
+    def wait(self):
+        """Block until the caller is allowed to start its next request"""
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
 
 class BoardMinutesBuddy:
     def __init__(self, root):
@@ -25,42 +171,77 @@ class BoardMinutesBuddy:
         self.root.resizable(True, True)
         
         # Configuration file for persistent settings
-        self.config_file = "board_minutes_config.ini"
-        self.config = configparser.ConfigParser()
+        self.config_file = "board_minutes_config.json"
+        self.legacy_config_file = "board_minutes_config.ini"
+        self.settings = {}
         self.load_settings()
         
+        # In-memory caches keyed by (path, mtime, size) so repeat runs skip disk work
+        self._examples_cache = {}
+        self._template_cache = {}
+        
+        # Shared OpenAI client, rebuilt only when the API key changes
+        self._client = None
+        self._client_lock = threading.Lock()
+        
+        # Resolved file locations as (path field value, resolved path), reused while the field is unchanged
+        self._cached_template_path = (None, None)
+        self._cached_examples_path = (None, None)
+        
         # Variables for file paths
         self.agenda_path = tk.StringVar()
         self.transcript_path = tk.StringVar()
         self.output_dir = tk.StringVar(value=str(Path.home()))
         
+        # Queued (agenda, transcript) path pairs for multi-meeting runs
+        self.meeting_queue = []
+        
+        # Log messages are queued from any thread and drained on the Tk main loop
+        self._log_q = queue.Queue()
+        
+        # One long-lived worker runs background tasks in order instead of a thread per click
+        self._work_q = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+        self._pending_tasks = 0  # only touched on the Tk main loop
+        # Tk variable values snapshotted for the task the worker is running; only the worker sets this
+        self._inputs = {}
+        
         self.setup_gui()
+        self.root.after(_LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
         
     def load_settings(self):
         """Load settings from config file"""
-        if os.path.exists(self.config_file):
-            self.config.read(self.config_file)
+        try:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                self.settings = json.load(f)
+        except FileNotFoundError:
+            self.settings = self.load_legacy_settings()
+        except (OSError, ValueError):
+            self.settings = {}
         
         # Set defaults if not present
-        if not self.config.has_section('Settings'):
-            self.config.add_section('Settings')
-        
-        if not self.config.has_option('Settings', 'model'):
-            self.config.set('Settings', 'model', 'gpt-4.1')
-        
-        if not self.config.has_option('Settings', 'api_key'):
-            self.config.set('Settings', 'api_key', '')
-        
-        if not self.config.has_option('Settings', 'template_path'):
-            self.config.set('Settings', 'template_path', '')
+        for key, value in _DEFAULT_SETTINGS.items():
+            self.settings.setdefault(key, value)
+    
+    def load_legacy_settings(self):
+        """Import settings from the old INI config file, if one exists"""
+        if not os.path.exists(self.legacy_config_file):
+            return {}
         
-        if not self.config.has_option('Settings', 'examples_path'):
-            self.config.set('Settings', 'examples_path', '')
+        try:
+            config = configparser.ConfigParser()
+            config.read(self.legacy_config_file)
+            if config.has_section('Settings'):
+                return dict(config['Settings'])
+        except configparser.Error:
+            pass
+        return {}
     
     def save_settings(self):
         """Save settings to config file"""
-        with open(self.config_file, 'w') as f:
-            self.config.write(f)
+        with open(self.config_file, 'w', encoding='utf-8') as f:
+            json.dump(self.settings, f, indent=2)
     
     def setup_gui(self):
         """Create the main GUI interface"""
@@ -111,19 +292,19 @@ class BoardMinutesBuddy:
         
         # Model selection
         ttk.Label(settings_frame, text="Model:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.model_var = tk.StringVar(value=self.config.get('Settings', 'model'))
+        self.model_var = tk.StringVar(value=self.settings['model'])
         model_entry = ttk.Entry(settings_frame, textvariable=self.model_var)
         model_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(10, 5), pady=2)
         
         # API Key
         ttk.Label(settings_frame, text="OpenAI API Key:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.api_key_var = tk.StringVar(value=self.config.get('Settings', 'api_key'))
+        self.api_key_var = tk.StringVar(value=self.settings['api_key'])
         api_key_entry = ttk.Entry(settings_frame, textvariable=self.api_key_var, show="*")
         api_key_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(10, 5), pady=2)
         
         # Template Path
         ttk.Label(settings_frame, text="Template File:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.template_path_var = tk.StringVar(value=self.config.get('Settings', 'template_path'))
+        self.template_path_var = tk.StringVar(value=self.settings['template_path'])
         template_entry = ttk.Entry(settings_frame, textvariable=self.template_path_var)
         template_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=(10, 5), pady=2)
         ttk.Button(settings_frame, text="Browse", 
@@ -131,22 +312,43 @@ class BoardMinutesBuddy:
         
         # Examples Path
         ttk.Label(settings_frame, text="Examples File:").grid(row=3, column=0, sticky=tk.W, pady=2)
-        self.examples_path_var = tk.StringVar(value=self.config.get('Settings', 'examples_path'))
+        self.examples_path_var = tk.StringVar(value=self.settings['examples_path'])
         examples_entry = ttk.Entry(settings_frame, textvariable=self.examples_path_var)
         examples_entry.grid(row=3, column=1, sticky=(tk.W, tk.E), padx=(10, 5), pady=2)
         ttk.Button(settings_frame, text="Browse", 
                   command=self.browse_examples).grid(row=3, column=2, pady=2)
         
+        # Queued meeting request mode
+        self.combine_requests_var = tk.BooleanVar(value=self.settings['combine_requests'])
+        ttk.Checkbutton(settings_frame, text="Combine queued meetings into one request",
+                        variable=self.combine_requests_var).grid(row=4, column=0, columnspan=3, sticky=tk.W, pady=2)
+        
         # Control buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=3, column=0, columnspan=3, pady=10)
         
         self.generate_button = ttk.Button(button_frame, text="Generate Minutes", 
                                          command=self.generate_minutes_thread)
-        self.generate_button.pack(side=tk.LEFT, padx=5)
+        self.generate_button.grid(row=0, column=0, padx=5, pady=2)
         
         ttk.Button(button_frame, text="Save Settings", 
-                  command=self.save_settings_gui).pack(side=tk.LEFT, padx=5)
+                  command=self.save_settings_gui).grid(row=0, column=1, padx=5, pady=2)
+        
+        # Queue and batch actions on a second row so the buttons fit the default window width
+        queue_frame = ttk.Frame(button_frame)
+        queue_frame.grid(row=1, column=0, columnspan=2, pady=2)
+        
+        ttk.Button(queue_frame, text="Add to Queue", 
+                  command=self.add_to_queue).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Button(queue_frame, text="Clear Queue", 
+                  command=self.clear_queue).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Button(queue_frame, text="Submit as Batch", 
+                  command=self.submit_batch_thread).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Button(queue_frame, text="Check Batch", 
+                  command=self.check_batch_thread).pack(side=tk.LEFT, padx=5)
         
         # Progress bar
         self.progress = ttk.Progressbar(main_frame, mode='indeterminate')
@@ -210,18 +412,53 @@ class BoardMinutesBuddy:
     
     def save_settings_gui(self):
         """Save settings from GUI"""
-        self.config.set('Settings', 'model', self.model_var.get())
-        self.config.set('Settings', 'api_key', self.api_key_var.get())
-        self.config.set('Settings', 'template_path', self.template_path_var.get())
-        self.config.set('Settings', 'examples_path', self.examples_path_var.get())
+        self.settings['model'] = self.model_var.get()
+        self.settings['api_key'] = self.api_key_var.get()
+        self.settings['template_path'] = self.template_path_var.get()
+        self.settings['examples_path'] = self.examples_path_var.get()
+        self.settings['combine_requests'] = self.combine_requests_var.get()
         self.save_settings()
         self.log("Settings saved successfully!")
     
+    def add_to_queue(self):
+        """Queue the selected agenda and transcript for a multi-meeting run"""
+        agenda_path = self.agenda_path.get()
+        transcript_path = self.transcript_path.get()
+        if not agenda_path or not transcript_path:
+            self.log("Please select an agenda and transcript file to queue.")
+            return
+        
+        self.meeting_queue.append((agenda_path, transcript_path))
+        self.log(f"Queued meeting {len(self.meeting_queue)}: {Path(agenda_path).name}")
+    
+    def _dequeue(self, meetings):
+        """Remove finished meetings from the queue on the Tk main loop, if still queued"""
+        for meeting in meetings:
+            if meeting in self.meeting_queue:
+                self.meeting_queue.remove(meeting)
+    
+    def clear_queue(self):
+        """Remove all queued meetings"""
+        self.meeting_queue.clear()
+        self.log("Meeting queue cleared.")
+    
     def log(self, message):
-        """Add message to log area"""
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """Queue a message for the log area (safe to call from any thread)"""
+        self._log_q.put(message)
+    
+    def _drain_log_queue(self):
+        """Append all pending log messages in one update, then reschedule"""
+        batch = []
+        try:
+            while True:
+                batch.append(self._log_q.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if batch:
+            self.log_text.insert(tk.END, '\n'.join(batch) + '\n')
+            self.log_text.see(tk.END)
+        self.root.after(_LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
     
     def extract_word_text(self, filepath):
         """Extract text from Word document with improved formatting preservation"""
@@ -230,30 +467,27 @@ class BoardMinutesBuddy:
             text_content = []
             
             for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    # Preserve basic structure and detect headings
-                    text = paragraph.text.strip()
-                    
-                    # Check if paragraph style suggests it's a heading
-                    if paragraph.style.name.lower().startswith('heading'):
-                        # Add markdown-style heading markers based on level
-                        level = 1  # default
-                        if 'heading 1' in paragraph.style.name.lower():
-                            level = 1
-                        elif 'heading 2' in paragraph.style.name.lower():
-                            level = 2
-                        elif 'heading 3' in paragraph.style.name.lower():
-                            level = 3
-                        text = '#' * level + ' ' + text
-                    
-                    text_content.append(text)
+                # Preserve basic structure and detect headings
+                text = paragraph.text.strip()
+                if not text:
+                    continue
+                
+                # Only replace multiple spaces/tabs, but preserve newlines
+                text = _SPACE_TAB.sub(' ', text)
+                # Line breaks inside a paragraph: clean up excessive newlines (3+ becomes 2)
+                if '\n' in text:
+                    text = _MULTI_NL.sub('\n\n', text)
+                
+                # Check if paragraph style suggests it's a heading
+                style_name = paragraph.style.name.lower()
+                if style_name.startswith('heading'):
+                    # Add markdown-style heading markers based on level
+                    text = '#' * _HEADING_LEVELS.get(style_name, 1) + ' ' + text
+                
+                text_content.append(text)
             
-            combined_text = '\n'.join(text_content)
-            # Only replace multiple spaces/tabs, but preserve newlines
-            combined_text = re.sub(r'[ \t]+', ' ', combined_text)
-            # Clean up excessive newlines (3+ becomes 2)
-            combined_text = re.sub(r'\n{3,}', '\n\n', combined_text)
-            return combined_text.strip()
+            # Paragraphs are already normalized, so no pass over the joined text is needed
+            return '\n'.join(text_content)
             
         except Exception as e:
             self.log(f"Error reading Word document {filepath}: {str(e)}")
@@ -262,23 +496,26 @@ class BoardMinutesBuddy:
     def extract_vtt_text(self, filepath):
         """Extract text from VTT transcript file with improved cleaning"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-            
             # Remove VTT header and timestamp lines
             # VTT format: WEBVTT, timestamps (00:00:00.000 --> 00:00:00.000), then speaker: text
-            content_lines = []
-            for line in lines:
-                line = line.strip()
-                # Skip VTT headers, timestamps, and empty lines
-                if not re.match(r'^WEBVTT|^NOTE|^\d{2}:\d{2}:\d{2}\.\d{3}', line) and line:
-                    content_lines.append(line)
+            buf = io.StringIO()
+            with open(filepath, 'r', encoding='utf-8', buffering=_READ_BUFFER_SIZE) as file:
+                # Stream the file so large transcripts are walked only once
+                for line in file:
+                    line = line.strip()
+                    # Skip VTT headers, timestamps, and empty lines. Stands in for
+                    # r'^(?:WEBVTT|NOTE|\d{2}:\d{2}:\d{2}\.\d{3})' using fixed-offset checks
+                    if not line or line.startswith(('WEBVTT', 'NOTE')):
+                        continue
+                    if (len(line) >= 12 and line[2] == ':' and line[5] == ':' and line[8] == '.'
+                            and line[:2].isdigit() and line[3:5].isdigit() and line[6:8].isdigit()
+                            and line[9:12].isdigit()):
+                        continue
+                    buf.write(line)
+                    buf.write(' ')
             
-            # Combine speaker attributions and dialogue
-            transcript_text = ' '.join(content_lines)
-            # Clean up excessive whitespace
-            transcript_text = re.sub(r'\s+', ' ', transcript_text)
-            return transcript_text.strip()
+            # Combine speaker attributions and dialogue, cleaning up excessive whitespace
+            return _WS.sub(' ', buf.getvalue()).strip()
             
         except Exception as e:
             self.log(f"Error reading VTT file {filepath}: {str(e)}")
@@ -290,15 +527,29 @@ class BoardMinutesBuddy:
             return []
         
         try:
+            key = _file_cache_key(jsonl_path)
+            if key in self._examples_cache:
+                examples = self._examples_cache[key]
+                self.log(f"Loaded {len(examples)} examples from cache")
+                return examples
+            
+            # Reuse the already-validated examples from a previous run if still current
+            cache_path, cache_key = _examples_cache_entry(jsonl_path)
+            examples = self.load_examples_cache(cache_path, cache_key)
+            if examples is not None:
+                self._examples_cache = {key: examples}
+                self.log(f"Loaded {len(examples)} examples from the examples cache")
+                return examples
+            
             examples = []
-            with open(jsonl_path, 'r', encoding='utf-8') as file:
+            # Parse raw UTF-8 bytes directly rather than decoding each line first
+            with open(jsonl_path, 'rb', buffering=_READ_BUFFER_SIZE) as file:
                 for line_num, line in enumerate(file, 1):
-                    line = line.strip()
-                    if not line:
+                    if not line.strip():
                         continue
                     
                     try:
-                        example = json.loads(line)
+                        example = _json_loads(line)
                         
                         # Validate structure
                         if "messages" not in example or len(example["messages"]) < 3:
@@ -307,10 +558,13 @@ class BoardMinutesBuddy:
                         
                         examples.append(example)
                         
+                    # orjson.JSONDecodeError subclasses json.JSONDecodeError
                     except json.JSONDecodeError as e:
                         self.log(f"Warning: JSON decode error at line {line_num}: {str(e)}")
                         continue
             
+            self.save_examples_cache(cache_path, cache_key, examples)
+            self._examples_cache = {key: examples}
             self.log(f"Loaded {len(examples)} examples from JSONL file")
             return examples
             
@@ -318,126 +572,169 @@ class BoardMinutesBuddy:
             self.log(f"Error loading JSONL file {jsonl_path}: {str(e)}")
             return []
     
+    def load_examples_cache(self, cache_path, key):
+        """Load pickled examples if the cache was written for this exact JSONL file"""
+        # Only read from the per-user cache dir, never from beside a possibly shared examples file
+        try:
+            with open(cache_path, 'rb') as file:
+                source_key, examples = pickle.load(file)
+            return examples if source_key == key else None
+        except Exception:
+            # Missing, stale or unreadable cache - fall back to parsing the JSONL
+            return None
+    
+    def save_examples_cache(self, cache_path, key, examples):
+        """Write the parsed examples to the per-user cache for faster loading next run"""
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            # A unique temp file per writer, so concurrent loads cannot clobber each other
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    pickle.dump((key, examples), file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, cache_path)
+            except BaseException:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            # Unwritable cache locations just skip the cache
+            self.log(f"Note: could not write examples cache {cache_path}: {str(e)}")
+    
     def get_examples_file(self):
         """Get the examples file path from settings or find automatically"""
-        # First check if user has specified an examples path
-        examples_path = self.examples_path_var.get().strip()
+        examples_path = self._inputs['examples_path']
+        # Reuse the resolved file only for the same input and while it still exists
+        input_path, resolved = self._cached_examples_path
+        if input_path == examples_path and resolved and os.path.exists(resolved):
+            return resolved
         
+        # First check if user has specified an examples path
         if examples_path and os.path.exists(examples_path):
-            return examples_path
-        
-        # If no valid path in settings, try to find automatically
-        return self.find_examples_file()
+            resolved = examples_path
+        else:
+            # If no valid path in settings, try to find automatically
+            resolved = self.find_examples_file()
+        self._cached_examples_path = (examples_path, resolved)
+        return resolved
         
     def find_examples_file(self):
         """Find the example.jsonl file automatically"""
         # Look for examples file in common locations
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        search_locations = [
-            os.path.join(script_dir, "example.jsonl"),
-            os.path.join(os.getcwd(), "example.jsonl"),
-            os.path.join(str(Path.home()), "example.jsonl"),
-            os.path.join(str(Path.home()), "Documents", "example.jsonl")
-        ]
-        
-        for path in search_locations:
-            if os.path.exists(path):
-                return path
-        
-        return None
+        return _find_in_search_dirs(("example.jsonl",))
     
     def get_template_file(self):
         """Get the template file path from settings or find automatically"""
-        # First check if user has specified a template path
-        template_path = self.template_path_var.get().strip()
+        template_path = self._inputs['template_path']
+        # Reuse the resolved file only for the same input and while it still exists
+        input_path, resolved = self._cached_template_path
+        if input_path == template_path and resolved and os.path.exists(resolved):
+            return resolved
         
+        # First check if user has specified a template path
         if template_path and os.path.exists(template_path):
-            return template_path
-        
-        # If no valid path in settings, try to find automatically
-        return self.find_template_file()
+            resolved = template_path
+        else:
+            # If no valid path in settings, try to find automatically
+            resolved = self.find_template_file()
+        self._cached_template_path = (template_path, resolved)
+        return resolved
         
     def find_template_file(self):
         """Find the minutes_msword.dotx template file automatically"""
         # Look for template in common locations
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        search_locations = [
-            os.path.join(script_dir, "minutes_msword.dotx"),
-            os.path.join(script_dir, "minutes_msword.docx"),
-            os.path.join(os.getcwd(), "minutes_msword.dotx"),
-            os.path.join(os.getcwd(), "minutes_msword.docx"),
-            os.path.join(str(Path.home()), "minutes_msword.dotx"),
-            os.path.join(str(Path.home()), "minutes_msword.docx"),
-            os.path.join(str(Path.home()), "Documents", "minutes_msword.dotx"),
-            os.path.join(str(Path.home()), "Documents", "minutes_msword.docx")
-        ]
-        
-        for path in search_locations:
-            if os.path.exists(path):
-                return path
-        
-        return None
-    
-    def generate_minutes_chatgpt(self, agenda_text, transcript_text):
+        return _find_in_search_dirs(("minutes_msword.dotx", "minutes_msword.docx"))
+    
+    def _get_client(self):
+        """Return the shared OpenAI client, creating it on first use or after a key change"""
+        api_key = self._inputs['api_key']
+        with self._client_lock:
+            # Reusing one client keeps its HTTP connection pool alive across requests.
+            # The SDK's default timeout is kept, since long minutes can take minutes to generate
+            if self._client is None or self._client.api_key != api_key:
+                self._client = openai.OpenAI(api_key=api_key, max_retries=2)
+            return self._client
+    
+    def build_prompt_messages(self):
+        """Build the system prompt and one-shot example messages shared by every request"""
+        # Load examples from JSONL file
+        examples_file = self.get_examples_file()
+        if examples_file:
+            examples = self.load_examples_from_jsonl(examples_file)
+            self.log(f"Using examples from: {examples_file}")
+        else:
+            examples = []
+            self.log("No examples file found. Using zero-shot approach.")
+        
+        # System message
+        system_msg = {
+            "role": "system",
+            "content": ("You are an expert at creating structured meeting minutes for public agency board meetings. "
+                       "Given an agenda and meeting transcript, you produce concise, professional minutes that "
+                       "follow the agenda structure, cogently summarize key discussions without quotes, and "
+                       "particularly highlight board actions reached during the meeting ,"
+                       "(i.e., motions that are seconded and pass by vote using Robert's Rules of Order). "
+                       "Closely follow the style, formatting and conventions you observe in the included example.")
+        }
+        
+        # Build messages for one-shot learning
+        messages = [system_msg]
+        
+        # Add single example if available (one-shot approach)
+        if examples and len(examples) > 0:
+            # Use first example or random selection
+            selected_example = examples[0]  # or random.choice(examples)
+            
+            if 'messages' in selected_example and len(selected_example['messages']) >= 3:
+                # Add the example user message and assistant response
+                messages.append(selected_example['messages'][1])  # user message
+                messages.append(selected_example['messages'][2])  # assistant message
+                self.log("Using one-shot learning with example")
+        
+        return messages
+    
+    def build_task_message(self, agenda_text, transcript_text):
+        """Build the user message asking for minutes of a single meeting"""
+        return {
+            "role": "user",
+            "content": f"Please create meeting minutes based on this agenda and transcript.\n\nAGENDA:\n{agenda_text}\n\nTRANSCRIPT:\n{transcript_text}"
+        }
+    
+    def _estimate_max_tokens(self, transcript_text):
+        """Size the output token cap to the transcript instead of always reserving the maximum"""
+        # Roughly 4 characters per token; minutes run at most about half the transcript length
+        return max(_MIN_OUTPUT_TOKENS, min(_MAX_OUTPUT_TOKENS, len(transcript_text) // 8))
+    
+    def generate_minutes_chatgpt(self, agenda_text, transcript_text, prompt_messages=None):
         """Generate minutes using OpenAI API with one-shot learning from JSONL examples"""
         try:
-            # Set up OpenAI client
-            openai.api_key = self.api_key_var.get()
-            
-            # Load examples from JSONL file
-            examples_file = self.get_examples_file()
-            if examples_file:
-                examples = self.load_examples_from_jsonl(examples_file)
-                self.log(f"Using examples from: {examples_file}")
+            # Callers sending several requests build the shared prompt once and pass it in
+            if prompt_messages is None:
+                messages = self.build_prompt_messages()
             else:
-                examples = []
-                self.log("No examples file found. Using zero-shot approach.")
-            
-            # System message
-            system_msg = {
-                "role": "system",
-                "content": ("You are an expert at creating structured meeting minutes for public agency board meetings. "
-                           "Given an agenda and meeting transcript, you produce concise, professional minutes that "
-                           "follow the agenda structure, cogently summarize key discussions without quotes, and "
-                           "particularly highlight board actions reached during the meeting ,"
-                           "(i.e., motions that are seconded and pass by vote using Robert's Rules of Order). "
-                           "Closely follow the style, formatting and conventions you observe in the included example.")
-            }
-            
-            # Build messages for one-shot learning
-            messages = [system_msg]
-            
-            # Add single example if available (one-shot approach)
-            if examples and len(examples) > 0:
-                # Use first example or random selection
-                selected_example = examples[0]  # or random.choice(examples)
-                
-                if 'messages' in selected_example and len(selected_example['messages']) >= 3:
-                    # Add the example user message and assistant response
-                    messages.append(selected_example['messages'][1])  # user message
-                    messages.append(selected_example['messages'][2])  # assistant message
-                    self.log("Using one-shot learning with example")
+                messages = list(prompt_messages)
             
             # Add the current task
-            final_task = {
-                "role": "user",
-                "content": f"Please create meeting minutes based on this agenda and transcript.\n\nAGENDA:\n{agenda_text}\n\nTRANSCRIPT:\n{transcript_text}"
-            }
-            messages.append(final_task)
+            messages.append(self.build_task_message(agenda_text, transcript_text))
             
             self.log("Sending request to OpenAI...")
             
             # Make API call
-            response = openai.ChatCompletion.create(
-                model=self.model_var.get(),
+            response = self._get_client().chat.completions.create(
+                model=self._inputs['model'],
                 messages=messages,
-                max_tokens=6500,
+                max_tokens=self._estimate_max_tokens(transcript_text),
                 temperature=0.3
             )
             
-            minutes_rawtext = response.choices[0].message.content
+            choice = response.choices[0]
+            minutes_rawtext = choice.message.content
+            # The output cap scales with the transcript, so flag minutes that hit it
+            if choice.finish_reason == "length":
+                self.log("Warning: the minutes were cut off at the output token limit and may be incomplete")
             self.log("Minutes generated successfully!")
             return minutes_rawtext
             
@@ -445,6 +742,115 @@ class BoardMinutesBuddy:
             self.log(f"Error generating minutes: {str(e)}")
             return None
     
+    def generate_minutes_batch(self, pairs):
+        """Generate minutes for several (agenda, transcript) pairs in as few combined requests as fit"""
+        prompt_messages = self.build_prompt_messages()
+        results = [None] * len(pairs)
+        missing = []
+        for group in self._group_by_output_budget(pairs):
+            if len(group) == 1:
+                results[group[0]] = self.generate_minutes_chatgpt(*pairs[group[0]], prompt_messages)
+                continue
+            
+            group_results = self._generate_minutes_combined([pairs[i] for i in group], prompt_messages)
+            for i, minutes_rawtext in zip(group, group_results):
+                results[i] = minutes_rawtext
+                # Meetings the combined reply dropped or truncated get a request of their own;
+                # single-meeting groups already were one, so they are not sent again
+                if not minutes_rawtext:
+                    missing.append(i)
+        
+        if missing:
+            self.log(f"Retrying {len(missing)} meetings as individual requests...")
+            for i in missing:
+                results[i] = self.generate_minutes_chatgpt(*pairs[i], prompt_messages)
+        
+        return results
+    
+    def _group_by_output_budget(self, pairs):
+        """Split pair indices into groups whose summed output estimates fit one request"""
+        groups = []
+        group, budget = [], 0
+        for i, (_, transcript_text) in enumerate(pairs):
+            estimate = self._estimate_max_tokens(transcript_text)
+            if group and budget + estimate > _MAX_OUTPUT_TOKENS:
+                groups.append(group)
+                group, budget = [], 0
+            group.append(i)
+            budget += estimate
+        if group:
+            groups.append(group)
+        return groups
+    
+    def _generate_minutes_combined(self, pairs, prompt_messages):
+        """Send several (agenda, transcript) pairs in a single OpenAI request"""
+        try:
+            # System prompt and example are sent once for the whole group
+            messages = list(prompt_messages)
+            
+            meetings = [{"id": i, "agenda": agenda_text, "transcript": transcript_text}
+                        for i, (agenda_text, transcript_text) in enumerate(pairs)]
+            batch_task = {
+                "role": "user",
+                "content": ("Please create meeting minutes for each of the following meetings, based on its agenda and transcript. "
+                            "Respond with a JSON object of the form "
+                            '{"minutes": [{"id": <meeting id>, "minutes": "<minutes text>"}]} '
+                            "containing exactly one entry per meeting.\n\n"
+                            f"MEETINGS:\n{json.dumps(meetings, ensure_ascii=False)}")
+            }
+            messages.append(batch_task)
+            
+            self.log(f"Sending combined request for {len(pairs)} meetings to OpenAI...")
+            
+            # Make API call; the groups are sized so the summed estimates fit one request's cap
+            response = self._get_client().chat.completions.create(
+                model=self._inputs['model'],
+                messages=messages,
+                max_tokens=sum(self._estimate_max_tokens(transcript_text) for _, transcript_text in pairs),
+                temperature=0.3,
+                response_format={"type": "json_object"}
+            )
+            
+            content = json.loads(response.choices[0].message.content)
+            minutes_by_id = {}
+            for item in content.get("minutes", []):
+                # The model may echo ids back as strings
+                try:
+                    minutes_by_id[int(item.get("id"))] = item.get("minutes")
+                except (TypeError, ValueError):
+                    continue
+            results = [minutes_by_id.get(i) for i in range(len(pairs))]
+            
+            missing = sum(1 for minutes_rawtext in results if not minutes_rawtext)
+            if missing:
+                self.log(f"Warning: combined response was missing minutes for {missing} meetings")
+            self.log(f"Combined minutes generated for {len(pairs) - missing} meetings")
+            return results
+            
+        except Exception as e:
+            self.log(f"Error generating combined minutes: {str(e)}")
+            return [None] * len(pairs)
+    
+    def generate_minutes_parallel(self, pairs):
+        """Generate minutes for several (agenda, transcript) pairs with concurrent per-meeting requests"""
+        max_workers = max(1, int(self.settings['parallel_requests']))
+        limiter = _RateLimiter(int(self.settings['requests_per_minute']))
+        # Resolve and parse the examples once here rather than in every worker
+        prompt_messages = self.build_prompt_messages()
+        
+        def generate(pair):
+            limiter.wait()
+            return self.generate_minutes_chatgpt(*pair, prompt_messages)
+        
+        self.log(f"Sending {len(pairs)} requests to OpenAI, up to {max_workers} at a time...")
+        results = [None] * len(pairs)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            futures = {executor.submit(generate, pair): i for i, pair in enumerate(pairs)}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
+    
     def minutes_to_word_template(self, minutes_text, output_path):
         """Convert minutes text to formatted Word document using template"""
         try:
@@ -466,7 +872,7 @@ class BoardMinutesBuddy:
                     
                 elif template_path.lower().endswith('.docx'):
                     # Load the .docx template
-                    doc = Document(template_path)
+                    doc = self.load_template_document(template_path)
                     self.log("Loaded .docx template successfully")
                     
                     # Don't clear content - preserve logo and existing formatting
@@ -505,6 +911,17 @@ class BoardMinutesBuddy:
             except Exception as fallback_error:
                 self.log(f"Fallback also failed: {str(fallback_error)}")
     
+    def load_template_document(self, template_path):
+        """Open a fresh Document from the template, reusing its bytes across runs"""
+        # Cache the raw bytes rather than the Document, since python-docx mutates it
+        key = _file_cache_key(template_path)
+        template_bytes = self._template_cache.get(key)
+        if template_bytes is None:
+            with open(template_path, 'rb') as file:
+                template_bytes = file.read()
+            self._template_cache = {key: template_bytes}
+        return Document(io.BytesIO(template_bytes))
+    
     def setup_psrc_styles(self, doc):
         """Set up PSRC-style formatting for documents"""
         try:
@@ -532,14 +949,13 @@ class BoardMinutesBuddy:
         """Clear existing content from template while preserving styles"""
         try:
             # Remove all paragraphs except the first one (which may contain important styles)
-            paragraphs_to_remove = []
-            for i, paragraph in enumerate(doc.paragraphs):
-                if i > 0:  # Keep the first paragraph for style reference
-                    paragraphs_to_remove.append(paragraph)
-            
-            for paragraph in paragraphs_to_remove:
-                p = paragraph._element
-                p.getparent().remove(p)
+            paragraphs = doc.paragraphs
+            if len(paragraphs) > 1:
+                body = paragraphs[0]._element.getparent()
+                remove = body.remove
+                # Remove from the end so each removal touches the fewest trailing siblings
+                for paragraph in reversed(paragraphs[1:]):
+                    remove(paragraph._element)
                 
             self.log("Template content cleared successfully")
             
@@ -552,83 +968,88 @@ class BoardMinutesBuddy:
         try:
             # Split content into lines
             lines = minutes_text.split('\n')
-            current_paragraph = []
+            # Accumulate paragraph text in one buffer rather than re-joining a word list
+            current_paragraph = io.StringIO()
             in_list = False
+            add_heading = doc.add_heading
+            classify_heading = self._classify_heading
+            # Look the style up once per document instead of catching a failure per paragraph
+            has_quote_style = _has_style(doc, 'Quote')
             
             for line in lines:
-                original_line = line
+                # Blank and whitespace-only lines stop here, before any regex or heading checks
                 line = line.strip()
                 
                 if not line:
                     # Empty line - end current paragraph if it exists
-                    if current_paragraph:
-                        paragraph_text = ' '.join(current_paragraph)
-                        self.add_formatted_paragraph(doc, paragraph_text, in_list)
-                        current_paragraph = []
+                    if current_paragraph.tell():
+                        paragraph_text = current_paragraph.getvalue().rstrip()
+                        self.add_formatted_paragraph(doc, paragraph_text, in_list, has_quote_style)
+                        current_paragraph = io.StringIO()
                         in_list = False
                     continue
                 
                 # Check for markdown headings first
                 if line.startswith('#'):
                     # Add any accumulated paragraph first
-                    if current_paragraph:
-                        paragraph_text = ' '.join(current_paragraph)
-                        self.add_formatted_paragraph(doc, paragraph_text, in_list)
-                        current_paragraph = []
+                    if current_paragraph.tell():
+                        paragraph_text = current_paragraph.getvalue().rstrip()
+                        self.add_formatted_paragraph(doc, paragraph_text, in_list, has_quote_style)
+                        current_paragraph = io.StringIO()
                         in_list = False
                     
                     # Process markdown headings
-                    heading_match = re.match(r'^(#{1,6})\s+(.*)', line)
+                    heading_match = _HEADING_MD.match(line)
                     if heading_match:
                         level = len(heading_match.group(1))
                         heading_text = heading_match.group(2)
-                        doc.add_heading(heading_text, level=min(level, 3))
+                        add_heading(heading_text, level=min(level, 3))
                     continue
                 
                 # Check for bullet points or list items
-                if re.match(r'^[-*+]\s+', line) or re.match(r'^\d+\.\s+', line):
+                if _BULLET.match(line) or _NUMLIST.match(line):
                     # Add any accumulated paragraph first
-                    if current_paragraph and not in_list:
-                        paragraph_text = ' '.join(current_paragraph)
-                        self.add_formatted_paragraph(doc, paragraph_text, False)
-                        current_paragraph = []
+                    if current_paragraph.tell() and not in_list:
+                        paragraph_text = current_paragraph.getvalue().rstrip()
+                        self.add_formatted_paragraph(doc, paragraph_text, False, has_quote_style)
+                        current_paragraph = io.StringIO()
                     
                     # Process list item
-                    list_text = re.sub(r'^[-*+]\s+', '', line)  # Remove bullet
-                    list_text = re.sub(r'^\d+\.\s+', '', list_text)  # Remove number
+                    list_text = _BULLET.sub('', line)  # Remove bullet
+                    list_text = _NUMLIST.sub('', list_text)  # Remove number
                     self.add_list_item(doc, list_text)
                     in_list = True
                     continue
                 
                 # Check if line looks like a heading (non-markdown)
-                elif self.is_heading(line):
+                is_heading, heading_level = classify_heading(line)
+                if is_heading:
                     # Add any accumulated paragraph first
-                    if current_paragraph:
-                        paragraph_text = ' '.join(current_paragraph)
-                        self.add_formatted_paragraph(doc, paragraph_text, in_list)
-                        current_paragraph = []
+                    if current_paragraph.tell():
+                        paragraph_text = current_paragraph.getvalue().rstrip()
+                        self.add_formatted_paragraph(doc, paragraph_text, in_list, has_quote_style)
+                        current_paragraph = io.StringIO()
                         in_list = False
                     
-                    # Determine heading level for non-markdown headings
-                    heading_level = self.get_heading_level(line)
-                    doc.add_heading(line, level=heading_level)
+                    add_heading(line, level=heading_level)
                     continue
                 
                 else:
                     # Regular content - accumulate into paragraph
-                    if in_list and current_paragraph:
+                    if in_list and current_paragraph.tell():
                         # If we were in a list but now have regular text, end the list
-                        paragraph_text = ' '.join(current_paragraph)
-                        self.add_formatted_paragraph(doc, paragraph_text, True)
-                        current_paragraph = []
+                        paragraph_text = current_paragraph.getvalue().rstrip()
+                        self.add_formatted_paragraph(doc, paragraph_text, True, has_quote_style)
+                        current_paragraph = io.StringIO()
                         in_list = False
                     
-                    current_paragraph.append(line)
+                    current_paragraph.write(line)
+                    current_paragraph.write(' ')
             
             # Add any remaining paragraph
-            if current_paragraph:
-                paragraph_text = ' '.join(current_paragraph)
-                self.add_formatted_paragraph(doc, paragraph_text, in_list)
+            if current_paragraph.tell():
+                paragraph_text = current_paragraph.getvalue().rstrip()
+                self.add_formatted_paragraph(doc, paragraph_text, in_list, has_quote_style)
                 
         except Exception as e:
             self.log(f"Error parsing content: {str(e)}")
@@ -651,246 +1072,495 @@ class BoardMinutesBuddy:
             
         except Exception as e:
             # Fallback to regular paragraph with bullet
+            self.log(f"Error formatting list item: {str(e)}")
             doc.add_paragraph(f"• {text}")
     
-    def add_formatted_paragraph(self, doc, text, is_list_continuation=False):
+    def add_formatted_paragraph(self, doc, text, is_list_continuation=False, has_quote_style=None):
         """Add a paragraph with formatting support and proper styles"""
+        if has_quote_style is None:
+            has_quote_style = _has_style(doc, 'Quote')
+        
         try:
-            # Check for special formatting patterns
-            if re.match(r'^\*\*Action:\*\*', text, re.IGNORECASE):
-                # ACTION items - use special formatting
-                p = doc.add_paragraph()
-                # Remove markdown formatting and add as bold
-                clean_text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-                run = p.add_run(clean_text)
-                run.bold = True
-                # Try to apply a specific style if available
-                try:
-                    p.style = 'Quote'  # or 'Intense Quote' if available
-                except:
-                    pass  # Style not available, continue with bold formatting
-                    
-            elif re.match(r'^\*\*(.*?)\*\*', text):
-                # Other bold headers - check if they're section headers
-                if any(keyword in text.upper() for keyword in ['CALL TO ORDER', 'COMMUNICATIONS', 'CONSENT AGENDA', 'ACTION ITEM', 'DISCUSSION', 'INFORMATION', 'ADJOURN']):
-                    # This is a section header
-                    header_text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-                    p = doc.add_heading(header_text, level=1)
-                else:
-                    # Regular bold paragraph
-                    p = doc.add_paragraph()
-                    self.add_formatted_text_to_paragraph(p, text)
-                    
-            elif text.startswith('>'):
-                # Block quote - remove > and make italic
-                clean_text = text.lstrip('> ')
-                p = doc.add_paragraph()
-                run = p.add_run(clean_text)
-                run.italic = True
-                try:
-                    p.style = 'Quote'
-                except:
-                    pass
-                    
-            else:
-                # Regular paragraph
-                p = doc.add_paragraph()
-                self.add_formatted_text_to_paragraph(p, text)
+            # Pick the paragraph kind from the first character; plain text is the common case
+            handlers = self._PARAGRAPH_HANDLERS
+            handler = handlers.get(text[:1], handlers[''])
+            handler(self, doc, text, has_quote_style)
                 
         except Exception as e:
             # Fallback to simple paragraph
+            self.log(f"Error formatting paragraph: {str(e)}")
             doc.add_paragraph(text)
     
+    def _add_bold_paragraph(self, doc, text, has_quote_style):
+        """Add a paragraph that starts with '*': ACTION item, bold section header or plain text"""
+        # Leading **bold** span found with plain string scans rather than a regex match
+        bold_end = text.find('**', 2) if text.startswith('**') else -1
+        if bold_end < 0:
+            # A single '*' (italic) opener is just a regular paragraph
+            self._add_plain_paragraph(doc, text)
+            return
+        
+        bold_text = text[2:bold_end]
+        # Upper-case the leading bold span once for both the action and section checks
+        bold_upper = bold_text.upper()
+        if bold_upper == 'ACTION:':
+            # ACTION items - use special formatting
+            p = doc.add_paragraph()
+            # Remove markdown formatting and add as bold; only the tail can still hold markers
+            clean_text = bold_text + _BOLD_RE.sub(r'\1', text[bold_end + 2:])
+            run = p.add_run(clean_text)
+            run.bold = True
+            # Apply a specific style if available, otherwise keep just the bold formatting
+            if has_quote_style:
+                p.style = 'Quote'  # or 'Intense Quote' if available
+                
+        # Other bold headers - check if they're section headers
+        # Exact keyword headers hit the set; numbered or longer ones need the search
+        elif bold_upper.strip() in _SECTION_KEYWORDS or _SECTION_HDR_RE.search(bold_upper):
+            # This is a section header - reuse the leading span rather than rescanning the line
+            doc.add_heading(bold_text + _BOLD_RE.sub(r'\1', text[bold_end + 2:]), level=1)
+        else:
+            # Regular bold paragraph
+            self._add_plain_paragraph(doc, text)
+    
+    def _add_quote_paragraph(self, doc, text, has_quote_style):
+        """Add a block quote - remove the "> " marker and make italic"""
+        clean_text = text[2:] if text[1:2] == ' ' else text[1:]
+        p = doc.add_paragraph()
+        run = p.add_run(clean_text)
+        run.italic = True
+        if has_quote_style:
+            p.style = 'Quote'
+    
+    def _add_plain_paragraph(self, doc, text, has_quote_style=False):
+        """Add a regular paragraph with inline formatting (has_quote_style only fits the handler signature)"""
+        p = doc.add_paragraph()
+        self.add_formatted_text_to_paragraph(p, text)
+    
+    # First-character dispatch used by add_formatted_paragraph ('#' headings never reach it);
+    # the '' entry is the plain-text default for every other first character
+    _PARAGRAPH_HANDLERS = {'*': _add_bold_paragraph, '>': _add_quote_paragraph, '': _add_plain_paragraph}
+    
     def add_formatted_text_to_paragraph(self, paragraph, text):
         """Add text with inline formatting (bold, italic) to a paragraph"""
-        try:
-            # Split text by formatting markers
-            parts = []
-            current_pos = 0
-            
-            # Find all bold (**text**) and italic (*text*) patterns
-            bold_pattern = r'\*\*(.*?)\*\*'
-            italic_pattern = r'(?<!\*)\*([^*]+?)\*(?!\*)'
-            
-            # Process bold formatting first
-            for match in re.finditer(bold_pattern, text):
-                # Add text before bold
-                if match.start() > current_pos:
-                    parts.append(('normal', text[current_pos:match.start()]))
-                # Add bold text
-                parts.append(('bold', match.group(1)))
-                current_pos = match.end()
-            
-            # Add remaining text
-            if current_pos < len(text):
-                remaining_text = text[current_pos:]
-                
-                # Process italic in remaining text
-                italic_parts = []
-                current_italic_pos = 0
-                
-                for match in re.finditer(italic_pattern, remaining_text):
-                    # Add text before italic
-                    if match.start() > current_italic_pos:
-                        italic_parts.append(('normal', remaining_text[current_italic_pos:match.start()]))
-                    # Add italic text
-                    italic_parts.append(('italic', match.group(1)))
-                    current_italic_pos = match.end()
-                
-                # Add final remaining text
-                if current_italic_pos < len(remaining_text):
-                    italic_parts.append(('normal', remaining_text[current_italic_pos:]))
-                
-                parts.extend(italic_parts if italic_parts else [('normal', remaining_text)])
-            
-            # If no formatting found, add as normal text
-            if not parts:
-                parts = [('normal', text)]
-            
-            # Add runs to paragraph
-            for format_type, content in parts:
-                if content.strip():  # Only add non-empty content
-                    run = paragraph.add_run(content)
-                    if format_type == 'bold':
-                        run.bold = True
-                    elif format_type == 'italic':
-                        run.italic = True
-                        
-        except Exception as e:
-            # Fallback: add as plain text
-            paragraph.add_run(text)
+        # Tokenize bold (**text**) and italic (*text*) spans in a single pass
+        add_run = paragraph.add_run
+        pos = 0
+        for match in _INLINE_RE.finditer(text):
+            start = match.start()
+            # Add text before the formatted span
+            if start > pos:
+                add_run(text[pos:start])
+            bold_text = match.group('b')
+            if bold_text is not None:
+                add_run(bold_text).bold = True
+            else:
+                add_run(match.group('i')).italic = True
+            pos = match.end()
+        
+        # Add remaining text
+        if pos < len(text):
+            add_run(text[pos:])
     
     def is_heading(self, line):
         """Determine if a line should be treated as a heading"""
-        # Skip markdown-style headings (handled separately)
-        if line.startswith('#'):
-            return False
-            
-        # Skip lines that start with formatting markers
-        if line.startswith('**') or line.startswith('*'):
-            return False
-            
+        return self._detect_heading(line)[0]
+    
+    def _detect_heading(self, line):
+        """Return (is_heading, match), where match is the heading-pattern match if one fired"""
         # Headings are typically:
         # - Short (less than 100 characters)
         # - Don't end with punctuation (except :)
         # - May be all caps or title case
         # - May start with numbers (1., I., A., etc.)
+        # Cheapest rejections run first, since body paragraphs dominate minutes
+        if not line or line.isspace():
+            return False, None
+        
+        # Skip markdown-style headings (handled separately) and formatting markers
+        if line[0] in '#*':
+            return False, None
         
         if len(line) > 100:
-            return False
-        
-        # Check for common heading patterns
-        heading_patterns = [
-            r'^\d+\.\s+',  # 1. 2. 3.
-            r'^[IVX]+\.\s+',  # I. II. III.
-            r'^[A-Z]\.\s+',  # A. B. C.
-            r'^[A-Z][A-Z\s]+:?',  # ALL CAPS
-            r'^\w+\s*(REPORT|MINUTES|AGENDA|DISCUSSION|ACTION|MOTION)',  # Common meeting terms
-            r'^(CALL TO ORDER|COMMUNICATIONS|CONSENT AGENDA|ACTION ITEMS|INFORMATION ITEMS|ADJOURN)',  # Meeting sections
-        ]
-        
-        for pattern in heading_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                return True
+            return False, None
+        
+        # Sentences are not headings
+        if line[-1] in '.!?':
+            return False, None
+        
+        # Meeting sections and common meeting terms
+        upper = line.upper()
+        if upper.startswith(_SECTIONS):
+            return True, None
+        
+        parts = upper.split(None, 1)
+        if parts and parts[0] in _MEETING_TERMS_SET:
+            return True, None
+        
+        # Check for common heading patterns, keeping the match for the level lookup
+        match = _HEADING_COMBINED.match(line)
+        if match:
+            return True, match
         
         # If line ends with : and is reasonably short, likely a heading
         if line.endswith(':') and len(line) < 80:
-            return True
+            return True, None
         
-        # If line is short and doesn't end with sentence punctuation
-        if len(line) < 60 and not line.endswith(('.', '!', '?')):
+        # If line is short (sentence punctuation was rejected above)
+        if len(line) < 60:
             # Check if it looks like a title (most words capitalized)
             words = line.split()
-            if len(words) > 1:
-                capitalized_words = sum(1 for word in words if word[0].isupper())
-                if capitalized_words >= len(words) * 0.7:  # 70% or more words capitalized
-                    return True
+            word_count = len(words)
+            if word_count > 1:
+                # Stop as soon as too many lowercase words rule out a title
+                min_capitalized = word_count * 0.7  # 70% or more words capitalized
+                lowercase_words = 0
+                for word in words:
+                    if not word[0].isupper():
+                        lowercase_words += 1
+                        if word_count - lowercase_words < min_capitalized:
+                            break
+                else:
+                    return True, None
         
-        return False
+        return False, None
     
-    def get_heading_level(self, line):
-        """Determine the heading level (1-3) based on the line content"""
-        # Level 1: Main sections, all caps, or numbered with single digit
-        if re.match(r'^[1-9]\.\s+', line) or line.isupper():
+    def _classify_heading(self, line):
+        """Return (is_heading, level) for a line in a single call"""
+        is_heading, match = self._detect_heading(line)
+        if not is_heading:
+            return False, None
+        return True, self.get_heading_level(line, match)
+    
+    def get_heading_level(self, line, match=None):
+        """Determine the heading level (1-3) from the line and its heading-pattern match"""
+        # Lines detected without a pattern match carry no numbering marker
+        # Level 1: Main sections, all caps, or numbered
+        if (match and match.group('num')) or line.isupper():
             return 1
         
         # Level 2: Subsections, lettered, or roman numerals
-        if re.match(r'^[A-Z]\.\s+|^[IVX]+\.\s+', line):
-            return 3
+        if match and (match.group('alpha') or match.group('roman')):
+            return 2
         
         # Level 3: Everything else
-        return 4  # Default to level 1 for simplicity
+        return 3
     
-    def generate_minutes_thread(self):
-        """Run minutes generation in separate thread"""
-        thread = threading.Thread(target=self.generate_minutes)
-        thread.daemon = True
-        thread.start()
+    def run_in_background(self, task):
+        """Queue task for the worker thread; only the completion callback touches Tk widgets"""
+        self.progress.start()
+        self.generate_button.config(state='disabled')
+        self._pending_tasks += 1
+        # Read the Tk variables here, so the worker and its pool threads never call into Tk
+        self._work_q.put((task, self._snapshot_inputs()))
     
-    def generate_minutes(self):
-        """Main function to generate minutes"""
+    def _snapshot_inputs(self):
+        """Capture the Tk variable values a background task needs (Tk main loop only)"""
+        return {
+            'agenda_path': self.agenda_path.get(),
+            'transcript_path': self.transcript_path.get(),
+            'output_dir': self.output_dir.get(),
+            'api_key': self.api_key_var.get(),
+            'model': self.model_var.get(),
+            'combine_requests': self.combine_requests_var.get(),
+            'template_path': self.template_path_var.get().strip(),
+            'examples_path': self.examples_path_var.get().strip(),
+            # The queue buttons stay live while the worker runs, so it works on a copy
+            'meetings': list(self.meeting_queue),
+        }
+    
+    def _worker_loop(self):
+        """Run queued background tasks one at a time for the lifetime of the app"""
+        while True:
+            task, self._inputs = self._work_q.get()
+            saved_paths, error = None, None
+            try:
+                saved_paths = task()
+            except Exception as e:
+                self.log(f"Unexpected error: {str(e)}")
+                error = e
+            # Post back to the Tk main loop once everything, including document saves, is done
+            self.root.after(0, self._on_done, saved_paths, error)
+    
+    def _on_done(self, saved_paths, error):
+        """Finish a background task on the Tk main loop"""
+        # Stop progress bar and re-enable button once nothing else is queued
+        self._pending_tasks -= 1
+        if not self._pending_tasks:
+            self.progress.stop()
+            self.generate_button.config(state='normal')
+        
+        if error is not None:
+            messagebox.showerror("Error", f"An error occurred: {str(error)}")
+        elif saved_paths:
+            messagebox.showinfo("Success", "Minutes saved to:\n" + "\n".join(str(p) for p in saved_paths))
+    
+    def submit_batch_thread(self):
+        """Run batch submission in separate thread"""
+        self.run_in_background(self.submit_batch)
+    
+    def check_batch_thread(self):
+        """Run batch status check in separate thread"""
+        self.run_in_background(self.check_batch)
+    
+    def submit_batch(self):
+        """Submit the queued meetings to the OpenAI Batch API for offline processing"""
         try:
-            # Validate inputs
-            if not self.agenda_path.get():
-                self.log("Please select an agenda file.")
+            if self.settings.get('batch_id'):
+                self.log(f"Batch {self.settings['batch_id']} is still pending. Use Check Batch first.")
                 return
             
-            if not self.transcript_path.get():
-                self.log("Please select a transcript file.")
+            meetings = self._inputs['meetings'] or [(self._inputs['agenda_path'], self._inputs['transcript_path'])]
+            if not all(agenda_path and transcript_path for agenda_path, transcript_path in meetings):
+                self.log("Please select an agenda and transcript file, or queue meetings.")
                 return
             
-            if not self.output_dir.get():
-                self.log("Please select an output directory.")
+            if not self._inputs['api_key']:
+                self.log("Please enter your OpenAI API key in settings.")
                 return
             
-            if not self.api_key_var.get():
-                self.log("Please enter your OpenAI API key in settings.")
+            self.log(f"Preparing batch of {len(meetings)} meetings...")
+            
+            # One JSONL request line per meeting, sharing the same prompt and example
+            prompt_messages = self.build_prompt_messages()
+            batch_meetings = {}
+            submitted = []
+            lines = []
+            for i, (agenda_path, transcript_path) in enumerate(meetings):
+                texts = self.extract_meeting_texts(agenda_path, transcript_path)
+                if not texts:
+                    continue
+                
+                custom_id = f"{i}-{Path(agenda_path).stem}"
+                batch_meetings[custom_id] = agenda_path
+                submitted.append((agenda_path, transcript_path))
+                lines.append(json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self._inputs['model'],
+                        "messages": prompt_messages + [self.build_task_message(*texts)],
+                        "max_tokens": self._estimate_max_tokens(texts[1]),
+                        "temperature": 0.3
+                    }
+                }, ensure_ascii=False))
+            
+            if not lines:
+                self.log("No meetings could be prepared for the batch.")
                 return
             
-            # Start progress bar
-            self.progress.start()
-            self.generate_button.config(state='disabled')
+            client = self._get_client()
+            batch_input = ('\n'.join(lines) + '\n').encode('utf-8')
+            input_file = client.files.create(file=("minutes_batch.jsonl", batch_input), purpose="batch")
+            batch = client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
             
-            self.log("Starting minutes generation...")
+            # Persist the batch so it can be checked after a restart
+            self.settings['batch_id'] = batch.id
+            self.settings['batch_meetings'] = batch_meetings
+            self.save_settings()
+            self.root.after(0, self._dequeue, submitted)
             
-            # Extract text from files
-            self.log("Extracting text from agenda...")
-            agenda_text = self.extract_word_text(self.agenda_path.get())
-            if not agenda_text:
-                self.log("Failed to extract agenda text.")
+            self.log(f"Submitted batch {batch.id} with {len(lines)} meetings. Use Check Batch to collect results.")
+            
+        except Exception as e:
+            self.log(f"Error submitting batch: {str(e)}")
+    
+    def check_batch(self):
+        """Check the pending OpenAI batch and return the saved paths once it has completed"""
+        try:
+            batch_id = self.settings.get('batch_id')
+            if not batch_id:
+                self.log("No batch is pending.")
                 return
             
-            self.log("Extracting text from transcript...")
-            transcript_text = self.extract_vtt_text(self.transcript_path.get())
-            if not transcript_text:
-                self.log("Failed to extract transcript text.")
+            if not self._inputs['output_dir']:
+                self.log("Please select an output directory.")
                 return
             
-            # Generate minutes
-            minutes_text = self.generate_minutes_chatgpt(agenda_text, transcript_text)
-            if not minutes_text:
+            client = self._get_client()
+            batch = client.batches.retrieve(batch_id)
+            self.log(f"Batch {batch_id} status: {batch.status}")
+            
+            if batch.status in ("failed", "expired", "cancelled"):
+                self.clear_pending_batch()
                 return
             
-            # Create output filename
-            agenda_filename = Path(self.agenda_path.get()).stem
-            output_filename = f"{agenda_filename}_minutes.docx"
-            output_path = Path(self.output_dir.get()) / output_filename
+            if batch.status != "completed":
+                return
             
-            # Save to Word document
-            self.log("Creating Word document...")
-            self.minutes_to_word_template(minutes_text, str(output_path))
+            batch_meetings = self.settings.get('batch_meetings', {})
+            saved_paths = []
+            if batch.output_file_id:
+                output = client.files.content(batch.output_file_id).text
+                for line in output.splitlines():
+                    if not line.strip():
+                        continue
+                    
+                    result = json.loads(line)
+                    custom_id = result.get("custom_id")
+                    response = result.get("response") or {}
+                    if result.get("error") or response.get("status_code") != 200:
+                        self.log(f"Batch request {custom_id} failed: {result.get('error') or response.get('body')}")
+                        continue
+                    
+                    choice = response["body"]["choices"][0]
+                    minutes_text = choice["message"]["content"]
+                    if choice.get("finish_reason") == "length":
+                        self.log(f"Warning: minutes for batch request {custom_id} were cut off at the output token limit")
+                    agenda_path = batch_meetings.get(custom_id, custom_id)
+                    output_path = self.get_output_path(agenda_path)
+                    self.log("Creating Word document...")
+                    self.minutes_to_word_template(minutes_text, str(output_path))
+                    saved_paths.append(output_path)
             
-            self.log("Minutes generation completed successfully!")
-            messagebox.showinfo("Success", f"Minutes saved to:\n{output_path}")
+            # Requests that failed are written to a separate error file, not the output file
+            if batch.error_file_id:
+                errors = client.files.content(batch.error_file_id).text
+                for line in errors.splitlines():
+                    if not line.strip():
+                        continue
+                    
+                    result = json.loads(line)
+                    response = result.get("response") or {}
+                    self.log(f"Batch request {result.get('custom_id')} failed: {result.get('error') or response.get('body')}")
+            
+            self.clear_pending_batch()
+            self.log(f"Batch complete: saved minutes for {len(saved_paths)} of {len(batch_meetings)} meetings.")
+            return saved_paths
             
         except Exception as e:
-            self.log(f"Unexpected error: {str(e)}")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            self.log(f"Error checking batch: {str(e)}")
+    
+    def clear_pending_batch(self):
+        """Forget the persisted batch once it has finished"""
+        self.settings.pop('batch_id', None)
+        self.settings.pop('batch_meetings', None)
+        self.save_settings()
+    
+    def generate_minutes_thread(self):
+        """Run minutes generation in separate thread"""
+        self.run_in_background(self.generate_minutes)
+    
+    def extract_meeting_texts(self, agenda_path, transcript_path):
+        """Extract agenda and transcript text for one meeting, or None on failure"""
+        # The two files are independent, so read and parse them concurrently
+        self.log("Extracting text from agenda and transcript...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            agenda_future = executor.submit(self.extract_word_text, agenda_path)
+            transcript_future = executor.submit(self.extract_vtt_text, transcript_path)
+            agenda_text = agenda_future.result()
+            transcript_text = transcript_future.result()
         
-        finally:
-            # Stop progress bar and re-enable button
-            self.progress.stop()
-            self.generate_button.config(state='normal')
+        if not agenda_text:
+            self.log("Failed to extract agenda text.")
+            return None
+        
+        if not transcript_text:
+            self.log("Failed to extract transcript text.")
+            return None
+        
+        return agenda_text, transcript_text
+    
+    def get_output_path(self, agenda_path):
+        """Build the output document path for a meeting from its agenda filename"""
+        agenda_filename = Path(agenda_path).stem
+        output_filename = f"{agenda_filename}_minutes.docx"
+        return Path(self._inputs['output_dir']) / output_filename
+    
+    def generate_queued_minutes(self, queued):
+        """Generate minutes for the queued meetings and return the saved paths"""
+        meetings = []
+        pairs = []
+        for agenda_path, transcript_path in queued:
+            self.log(f"Preparing queued meeting: {Path(agenda_path).name}")
+            texts = self.extract_meeting_texts(agenda_path, transcript_path)
+            if texts:
+                meetings.append((agenda_path, transcript_path))
+                pairs.append(texts)
+        
+        if not pairs:
+            self.log("No queued meetings could be prepared.")
+            return []
+        
+        if len(pairs) == 1:
+            minutes_list = [self.generate_minutes_chatgpt(*pairs[0])]
+        elif self._inputs['combine_requests']:
+            # Combine meetings into as few requests as fit so the prompt and example go out less often
+            minutes_list = self.generate_minutes_batch(pairs)
+        else:
+            minutes_list = self.generate_minutes_parallel(pairs)
+        
+        saved_paths = []
+        done = []
+        for meeting, minutes_text in zip(meetings, minutes_list):
+            if not minutes_text:
+                continue
+            
+            output_path = self.get_output_path(meeting[0])
+            self.log("Creating Word document...")
+            self.minutes_to_word_template(minutes_text, str(output_path))
+            done.append(meeting)
+            saved_paths.append(output_path)
+        
+        # Leave failed meetings queued so they can be retried
+        self.root.after(0, self._dequeue, done)
+        return saved_paths
+    
+    def generate_minutes(self):
+        """Main function to generate minutes, returning the saved document paths"""
+        inputs = self._inputs
+        queued = inputs['meetings']
+        # Validate inputs (queued meetings carry their own file paths)
+        if not queued:
+            if not inputs['agenda_path']:
+                self.log("Please select an agenda file.")
+                return None
+            
+            if not inputs['transcript_path']:
+                self.log("Please select a transcript file.")
+                return None
+        
+        if not inputs['output_dir']:
+            self.log("Please select an output directory.")
+            return None
+        
+        if not inputs['api_key']:
+            self.log("Please enter your OpenAI API key in settings.")
+            return None
+        
+        self.log("Starting minutes generation...")
+        
+        if queued:
+            saved_paths = self.generate_queued_minutes(queued)
+            if saved_paths:
+                self.log(f"Minutes generation completed for {len(saved_paths)} meetings!")
+            return saved_paths
+        
+        # Extract text from files
+        texts = self.extract_meeting_texts(inputs['agenda_path'], inputs['transcript_path'])
+        if not texts:
+            return None
+        agenda_text, transcript_text = texts
+        
+        # Generate minutes
+        minutes_text = self.generate_minutes_chatgpt(agenda_text, transcript_text)
+        if not minutes_text:
+            return None
+        
+        # Create output filename
+        output_path = self.get_output_path(inputs['agenda_path'])
+        
+        # Save to Word document
+        self.log("Creating Word document...")
+        self.minutes_to_word_template(minutes_text, str(output_path))
+        
+        self.log("Minutes generation completed successfully!")
+        return [output_path]
 
 def main():
     root = tk.Tk()